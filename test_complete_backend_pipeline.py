@@ -0,0 +1,69 @@
+"""
+Smoke tests for the bias detection pipeline
+
+OpenAI and article fetching are stubbed, so these run offline.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import orjson
+
+from complete_backend_pipeline import BiasDetectionEngine
+
+MODEL_REPLY = orjson.dumps({
+    "is": 40,
+    "fg": 80,
+    "fc": 30,
+    "et": 20,
+    "st": 90,
+    "confidence": 0.9,
+    "highlighted_phrases": {"is": ["phrase"]},
+    "reasoning": {"is": "Brief explanation"}
+}).decode()
+
+
+def make_engine():
+    """Engine with a stubbed model client and extractor that count their calls"""
+    engine = BiasDetectionEngine("test-key")
+    calls = {"model": 0, "extract": 0}
+
+    async def create(**kwargs):
+        calls["model"] += 1
+        message = SimpleNamespace(content=MODEL_REPLY)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    async def extract_article_content(url):
+        calls["extract"] += 1
+        return "How to protect your privacy", "TechCrunch", "A guide to the new settings"
+
+    engine.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    engine.extract_article_content = extract_article_content
+    return engine, calls
+
+
+def test_url_hash_is_stable_hex():
+    engine, _ = make_engine()
+    url_hash = engine._url_hash("https://techcrunch.com/article")
+
+    assert url_hash == engine._url_hash("https://techcrunch.com/article")
+    assert url_hash != engine._url_hash("https://techcrunch.com/other")
+    assert len(url_hash) == 16
+    int(url_hash, 16)
+
+
+def test_process_article_scores_and_caches():
+    engine, calls = make_engine()
+    url = "https://techcrunch.com/article"
+
+    first = asyncio.run(engine.process_article(url, "journalist"))
+    second = asyncio.run(engine.process_article(url, "journalist"))
+
+    assert first.status == "success"
+    assert first.scores["ideological_stance"] == 40.0
+    assert first.narrative_cluster == "technical_explainer"
+    assert first.article_id.endswith(engine._url_hash(url))
+    assert second.status == "success"
+    assert calls == {"model": 1, "extract": 1}
+    assert engine.metrics.articles_processed == 2
+    assert engine.business_metrics.active_users == 2